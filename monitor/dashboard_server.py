@@ -8,34 +8,81 @@ from TensorBoard event files produced by `mlagents-learn`.
 from __future__ import annotations
 
 import argparse
+import functools
+import gzip
+import hashlib
 import json
 import os
+import select
+import signal
+import socket
+import stat
+import struct
 import sys
 import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from http import HTTPStatus
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Dict, List, Optional
-from urllib.parse import parse_qs, urlparse
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote_plus, urlparse
 
 try:
-    from tensorboard.backend.event_processing import event_accumulator
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the stdlib encoder
+    orjson = None
+
+try:
+    from fastrlock.rlock import FastRLock as _Lock
+except ImportError:  # pragma: no cover - optional speedup for the hot cache lock
+    from threading import Lock as _Lock
+
+try:
+    import numpy as np
+    from google.protobuf.message import DecodeError
+    from tensorboard.compat.proto import event_pb2
 except ImportError:  # pragma: no cover - handled at runtime with a friendly error
-    event_accumulator = None
+    np = None
+    event_pb2 = None
+    DecodeError = ValueError
+
+# Upper bound on points returned per tag, and therefore kept per tag in memory.
+_MAX_POINTS = 2000
+# Reloads of the same event file closer together than this are skipped.
+_RELOAD_MIN_INTERVAL = 0.25
+# Bodies smaller than this are sent uncompressed; gzip framing would eat the gain.
+_GZIP_MIN_SIZE = 512
+_COMPRESSIBLE_SUFFIXES = {".html", ".js", ".css", ".json", ".svg", ".txt"}
+# Static files kept open for zero-copy serving; os.sendfile is POSIX-only.
+_OPEN_FILE_CACHE_SIZE = 32
+_HAS_SENDFILE = hasattr(os, "sendfile")
+# Largest request body accepted by /api/metrics/batch.
+_MAX_BATCH_BODY = 64 * 1024
+# --workers > 1 forks processes that accept from one shared listening socket.
+_CAN_PREFORK = hasattr(os, "fork")
+
+
+def _dumps(payload: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload, default=_json_default).encode("utf-8")
 
 
-def _default_size_guidance():
-    if event_accumulator is None:
-        return {}
-    return {
-        event_accumulator.SCALARS: 0,  # keep all scalars
-        event_accumulator.TENSORS: 0,
-        event_accumulator.COMPRESSED_HISTOGRAMS: 1,
-        event_accumulator.HISTOGRAMS: 1,
-        event_accumulator.IMAGES: 1,
-        event_accumulator.AUDIO: 1,
-    }
+def _loads(body: bytes):
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _json_default(obj):
+    # The stdlib encoder does not know numpy arrays; orjson handles them natively.
+    tolist = getattr(obj, "tolist", None)
+    if tolist is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return tolist()
 
 
 @dataclass
@@ -46,86 +93,627 @@ class BehaviorEventFile:
     updated_at: float
 
 
-def discover_runs(results_dir: Path) -> List[BehaviorEventFile]:
-    """Find TensorBoard event files under the ML-Agents results directory."""
-    runs: List[BehaviorEventFile] = []
-    if not results_dir.exists():
-        return runs
+# How long a discovered run list may be served before re-walking the results
+# directory even if its mtime is unchanged (new behaviors or event files inside
+# an existing run do not touch the top-level directory mtime).
+_RUNS_CACHE_TTL = 2.0
 
-    for run_dir in sorted(results_dir.iterdir()):
-        if not run_dir.is_dir():
-            continue
-        for behavior_dir in run_dir.iterdir():
-            if not behavior_dir.is_dir():
-                continue
-            event_files = list(behavior_dir.glob("events.out.tfevents.*"))
-            if not event_files:
+
+@dataclass
+class _RunsCache:
+    mtime: float
+    expires_at: float
+    runs: List[BehaviorEventFile]
+    by_key: Dict[Tuple[str, str], BehaviorEventFile]
+
+
+_runs_cache: Dict[Path, _RunsCache] = {}
+_runs_cache_lock = threading.Lock()
+
+
+_EVENT_FILE_PREFIX = "events.out.tfevents."
+
+
+def _latest_event_file(behavior_dir: str) -> Optional[Tuple[str, float]]:
+    """Return (path, mtime) of the newest event file directly inside `behavior_dir`.
+
+    A plain prefix test replaces glob's fnmatch; only matching regular files are
+    stat'ed, once each, via the DirEntry stat cache.
+    """
+    latest_path: Optional[str] = None
+    latest_mtime = 0.0
+    with os.scandir(behavior_dir) as files:
+        for entry in files:
+            if not entry.name.startswith(_EVENT_FILE_PREFIX) or not entry.is_file():
                 continue
-            latest = max(event_files, key=lambda p: p.stat().st_mtime)
-            runs.append(
-                BehaviorEventFile(
-                    run_id=run_dir.name,
-                    behavior=behavior_dir.name,
-                    event_path=latest,
-                    updated_at=latest.stat().st_mtime,
+            mtime = entry.stat().st_mtime
+            if latest_path is None or mtime > latest_mtime:
+                latest_path, latest_mtime = entry.path, mtime
+    if latest_path is None:
+        return None
+    return latest_path, latest_mtime
+
+
+def _walk_runs(results_dir: Path) -> List[BehaviorEventFile]:
+    runs: List[BehaviorEventFile] = []
+    with os.scandir(results_dir) as it:
+        run_entries = sorted(
+            (e for e in it if not e.is_symlink() and e.is_dir()), key=lambda e: e.name
+        )
+    for run_entry in run_entries:
+        with os.scandir(run_entry.path) as behaviors:
+            for behavior_entry in behaviors:
+                if behavior_entry.is_symlink() or not behavior_entry.is_dir():
+                    continue
+                latest = _latest_event_file(behavior_entry.path)
+                if latest is None:
+                    continue
+                runs.append(
+                    BehaviorEventFile(
+                        run_id=run_entry.name,
+                        behavior=behavior_entry.name,
+                        event_path=Path(latest[0]),
+                        updated_at=latest[1],
+                    )
                 )
-            )
     return runs
 
 
+def _cached_runs(results_dir: Path) -> Optional[_RunsCache]:
+    try:
+        mtime = os.stat(results_dir).st_mtime
+    except OSError:
+        return None
+
+    cached = _runs_cache.get(results_dir)
+    if cached is not None and cached.mtime == mtime and time.monotonic() < cached.expires_at:
+        return cached
+
+    # Walk outside the lock; concurrent misses at worst do the same walk twice.
+    runs = _walk_runs(results_dir)
+    fresh = _RunsCache(
+        mtime=mtime,
+        expires_at=time.monotonic() + _RUNS_CACHE_TTL,
+        runs=runs,
+        by_key={(r.run_id, r.behavior): r for r in runs},
+    )
+    with _runs_cache_lock:
+        _runs_cache[results_dir] = fresh
+    return fresh
+
+
+def discover_runs(results_dir: Path) -> List[BehaviorEventFile]:
+    """Find TensorBoard event files under the ML-Agents results directory.
+
+    Results are cached per directory and re-walked when the directory mtime
+    changes or the cache entry is older than `_RUNS_CACHE_TTL` seconds. The
+    returned list is shared between callers and must not be mutated.
+    """
+    cached = _cached_runs(results_dir)
+    return cached.runs if cached is not None else []
+
+
+def _is_path_component(name: str) -> bool:
+    # A single directory name: no separators, no drive ("C:" is drive-relative
+    # on Windows) and nothing that walks up or out of the parent directory.
+    return (
+        bool(name)
+        and name not in (".", "..")
+        and not any(sep in name for sep in (os.sep, os.altsep, "\0") if sep)
+        and not os.path.splitdrive(name)[0]
+        and os.path.basename(name) == name
+    )
+
+
+def locate_run(results_dir: Path, run_id: str, behavior: str) -> Optional[BehaviorEventFile]:
+    """Find a behavior's event file by scanning only `results_dir/run_id/behavior`.
+
+    Symlinked run and behavior directories are not followed, as in `discover_runs`.
+    """
+    if not _is_path_component(run_id) or not _is_path_component(behavior):
+        return None
+    run_dir = results_dir / run_id
+    behavior_dir = run_dir / behavior
+    if os.path.islink(run_dir) or os.path.islink(behavior_dir):
+        return None
+    try:
+        latest = _latest_event_file(str(behavior_dir))
+    except OSError:
+        return None
+    if latest is None:
+        return None
+    return BehaviorEventFile(
+        run_id=run_id, behavior=behavior, event_path=Path(latest[0]), updated_at=latest[1]
+    )
+
+
+def find_run(results_dir: Path, run_id: str, behavior: str) -> Optional[BehaviorEventFile]:
+    """Look up a single behavior's event file using the cached run index."""
+    cached = _cached_runs(results_dir)
+    if cached is None:
+        return None
+    return cached.by_key.get((run_id, behavior))
+
+
+# Columnar (steps, values, wall_times) arrays for one tag.
+ScalarColumns = Tuple["np.ndarray", "np.ndarray", "np.ndarray"]
+
+
+def _crc32c_table() -> Tuple[int, ...]:
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0x82F63B78 if crc & 1 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC32C_TABLE = _crc32c_table()
+
+
+def _masked_crc32c(data: bytes) -> int:
+    """CRC32C of `data`, masked the way TFRecord stores it."""
+    crc = 0xFFFFFFFF
+    for byte in data:
+        crc = _CRC32C_TABLE[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+    crc ^= 0xFFFFFFFF
+    return (((crc >> 15) | (crc << 17)) + 0xA282EAD8) & 0xFFFFFFFF
+
+
+class _ScalarRing:
+    """Fixed-capacity columnar ring buffer of (step, value, wall_time) samples."""
+
+    __slots__ = ("steps", "values", "wall_times", "head")
+
+    def __init__(self, capacity: int) -> None:
+        self.steps = np.empty(capacity, dtype=np.int64)
+        self.values = np.empty(capacity, dtype=np.float64)
+        self.wall_times = np.empty(capacity, dtype=np.float64)
+        self.head = 0  # total samples ever appended
+
+    def extend(self, steps: List[int], values: List[float], wall_times: List[float]) -> None:
+        """Append a batch of samples with at most two slice assignments per column."""
+        capacity = len(self.steps)
+        n = len(steps)
+        if n > capacity:
+            # Only the newest `capacity` samples would survive anyway.
+            skip = n - capacity
+            self.head += skip
+            steps, values, wall_times = steps[skip:], values[skip:], wall_times[skip:]
+            n = capacity
+        if n == 0:
+            return
+        start = self.head % capacity
+        first = min(n, capacity - start)
+        for dst, src, dtype in (
+            (self.steps, steps, np.int64),
+            (self.values, values, np.float64),
+            (self.wall_times, wall_times, np.float64),
+        ):
+            col = np.asarray(src, dtype=dtype)
+            dst[start : start + first] = col[:first]
+            dst[: n - first] = col[first:]
+        self.head += n
+
+    def tail(self, limit: int) -> ScalarColumns:
+        """Copy out the newest `limit` samples in append order."""
+        capacity = len(self.steps)
+        n = min(self.head, limit, capacity)
+        start = (self.head - n) % capacity
+        end = start + n
+        if end <= capacity:
+            return tuple(a[start:end].copy() for a in (self.steps, self.values, self.wall_times))
+        wrap = end - capacity
+        return tuple(
+            np.concatenate((a[start:], a[:wrap]))
+            for a in (self.steps, self.values, self.wall_times)
+        )
+
+
+class IncrementalTFEventReader:
+    """Tails a TensorBoard event file, keeping only recent scalar summaries.
+
+    Event files are TFRecord streams: an 8-byte little-endian length, a 4-byte
+    length CRC, the serialized `Event` proto, and a 4-byte data CRC. The reader
+    remembers the offset of the last complete record so each reload only parses
+    what the trainer appended since. The length CRC is checked before trusting
+    a length, and a record that runs past the end of the file is treated as a
+    torn tail and left for the next reload. Data CRCs are not checked; a record
+    whose proto fails to parse is skipped.
+
+    Each tag keeps its newest `maxlen` samples in a `_ScalarRing`. `loaded_mtime`
+    is the file mtime observed at the start of the last reload, so everything
+    written up to that mtime is reflected in `scalars()`.
+    """
+
+    def __init__(self, event_path: Path, maxlen: int = _MAX_POINTS) -> None:
+        self.event_path = event_path
+        self.loaded_mtime = 0.0
+        self._maxlen = maxlen
+        self._offset = 0
+        self._series: Dict[str, _ScalarRing] = {}
+        self._lock = threading.Lock()
+        # Reload coalescing state, guarded by _state_lock (never held while reading).
+        self._state_lock = threading.Lock()
+        self._inflight: Optional[Future] = None
+        self._last_reload = float("-inf")
+
+    def refresh(self, min_interval: float = _RELOAD_MIN_INTERVAL) -> None:
+        """Reload unless one finished recently; concurrent callers share one reload."""
+        with self._state_lock:
+            if time.monotonic() - self._last_reload < min_interval:
+                return
+            future = self._inflight
+            owner = future is None
+            if owner:
+                future = self._inflight = Future()
+        if not owner:
+            future.result()
+            return
+        try:
+            self.reload()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(None)
+            with self._state_lock:
+                self._last_reload = time.monotonic()
+        finally:
+            with self._state_lock:
+                self._inflight = None
+
+    def reload(self) -> None:
+        with self._lock, open(self.event_path, "rb") as f:
+            self.loaded_mtime = os.fstat(f.fileno()).st_mtime
+            size = f.seek(0, os.SEEK_END)
+            if size < self._offset:
+                # File was truncated or replaced; start over.
+                self._offset = 0
+                self._series.clear()
+            offset = self._offset
+            f.seek(offset)
+            # Gather new samples per tag first, then copy each column into its
+            # ring buffer in one vectorized step instead of element by element.
+            pending: Dict[str, Tuple[List[int], List[float], List[float]]] = {}
+            while True:
+                header = f.read(12)
+                if len(header) < 12:
+                    break
+                length, length_crc = struct.unpack("<QI", header)
+                if (
+                    length_crc != _masked_crc32c(header[:8])
+                    or length > size - f.tell() - 4
+                ):
+                    # Corrupt or not yet fully written; stop at the last good record.
+                    break
+                record = f.read(length + 4)
+                if len(record) < length + 4:
+                    break
+                self._ingest(record[:length], pending)
+                offset = f.tell()
+            for tag, columns in pending.items():
+                series = self._series.get(tag)
+                if series is None:
+                    series = self._series[tag] = _ScalarRing(self._maxlen)
+                series.extend(*columns)
+            self._offset = offset
+
+    @staticmethod
+    def _ingest(
+        record: bytes, pending: Dict[str, Tuple[List[int], List[float], List[float]]]
+    ) -> None:
+        try:
+            event = event_pb2.Event.FromString(record)
+        except DecodeError:
+            return
+        if not event.HasField("summary"):
+            return
+        for value in event.summary.value:
+            if not value.HasField("simple_value"):
+                continue
+            columns = pending.get(value.tag)
+            if columns is None:
+                columns = pending[value.tag] = ([], [], [])
+            columns[0].append(event.step)
+            columns[1].append(value.simple_value)
+            columns[2].append(event.wall_time)
+
+    def scalars(self, limit: int) -> Dict[str, ScalarColumns]:
+        """Return the last `limit` points of every scalar tag seen so far."""
+        with self._lock:
+            return {tag: series.tail(limit) for tag, series in self._series.items()}
+
+
 class EventCache:
-    """Caches EventAccumulators so we do not re-open files for every request."""
+    """Caches event readers so we do not re-read files for every request."""
 
     def __init__(self) -> None:
-        self._cache: Dict[Path, event_accumulator.EventAccumulator] = {}
-        self._lock = threading.Lock()
+        self._cache: Dict[Path, IncrementalTFEventReader] = {}
+        self._lock = _Lock()
 
-    def get(self, event_path: Path) -> event_accumulator.EventAccumulator:
-        if event_accumulator is None:
+    def get(self, event_path: Path) -> IncrementalTFEventReader:
+        if event_pb2 is None:
             raise RuntimeError(
                 "tensorboard is not installed. Install it with `pip install tensorboard`."
             )
+        # Readers are never removed, so a hit on the unlocked lookup (atomic
+        # under the GIL) is safe; only a miss takes the lock and re-checks.
+        # Each reader serializes its own reloads, so slow files do not block
+        # requests for other runs.
+        reader = self._cache.get(event_path)
+        if reader is None:
+            with self._lock:
+                reader = self._cache.get(event_path)
+                if reader is None:
+                    reader = IncrementalTFEventReader(event_path)
+                    self._cache[event_path] = reader
+        reader.refresh()
+        return reader
+
+
+# (event path, event file mtime, limit, half precision, gzip) -> (body, Content-Encoding)
+_ResponseKey = Tuple[str, float, int, bool, bool]
+_EncodedBody = Tuple[bytes, Optional[str]]
+
+
+class ResponseCache:
+    """Keeps serialized metrics bodies so unchanged event files skip re-encoding."""
+
+    def __init__(self, max_entries: int = 64) -> None:
+        self._entries: "OrderedDict[_ResponseKey, _EncodedBody]" = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, key: _ResponseKey) -> Optional[_EncodedBody]:
         with self._lock:
-            acc = self._cache.get(event_path)
-            if acc is None:
-                acc = event_accumulator.EventAccumulator(
-                    str(event_path), size_guidance=_default_size_guidance()
-                )
-                acc.Reload()
-                self._cache[event_path] = acc
-            else:
-                acc.Reload()
-            return acc
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: _ResponseKey, entry: _EncodedBody) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+# Dashboards poll a handful of fixed URLs, so parsing each distinct one once is enough.
+_parse_url = functools.lru_cache(maxsize=256)(urlparse)
+
+
+def _parse_metrics_query(
+    query: str,
+) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
+    """Extract (run, behavior, limit, precision) from a query string in one pass.
+
+    Like `parse_qs`, the first occurrence of a key wins and unknown keys are ignored.
+    """
+    run_id = behavior = limit = precision = None
+    for pair in query.split("&"):
+        key, sep, value = pair.partition("=")
+        if not sep:
+            continue
+        if key == "run":
+            if run_id is None:
+                run_id = unquote_plus(value)
+        elif key == "behavior":
+            if behavior is None:
+                behavior = unquote_plus(value)
+        elif key == "limit":
+            if limit is None:
+                limit = value
+        elif key == "precision":
+            if precision is None:
+                precision = value
+    return run_id, behavior, limit, precision
+
+
+def _parse_limit(raw) -> int:
+    try:
+        return min(_MAX_POINTS, max(1, int(raw)))
+    except (TypeError, ValueError, OverflowError):
+        # OverflowError: the stdlib JSON decoder turns 1e400 and Infinity into inf.
+        return 200
+
+
+def _round_significant(values: "np.ndarray", digits: int = 4) -> "np.ndarray":
+    """Round values to `digits` significant decimal digits so they print short.
+
+    Zeros and non-finite values keep their logged value.
+    """
+    values = values.astype(np.float64)
+    nonzero = np.isfinite(values) & (values != 0)
+    with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
+        magnitude = np.floor(np.log10(np.abs(np.where(nonzero, values, 1.0))))
+        exponent = digits - 1 - magnitude
+        # Powers of ten up to 1e22 are exact doubles. Scaling by one and
+        # dividing last gives the double nearest the rounded decimal.
+        up = np.power(10.0, np.clip(exponent, 0, 22))
+        down = np.power(10.0, np.clip(-exponent, 0, 22))
+        rounded = np.where(nonzero, np.round(values * up / down) * down / up, values)
+    # Magnitudes beyond that are rare enough to round one at a time.
+    for i in np.flatnonzero(nonzero & (np.abs(exponent) > 22)):
+        rounded[i] = float(f"{values[i]:.{digits}g}")
+    return rounded
+
+
+def _body_etag(body: bytes) -> str:
+    return '"%s"' % hashlib.blake2b(body, digest_size=8).hexdigest()
+
+
+@dataclass
+class _GzipAsset:
+    mtime: float
+    etag: str
+    body: bytes
+
+
+@dataclass
+class _OpenFile:
+    file: object  # unbuffered binary file; closed when the last reference drops
+    size: int
+    mtime: float
+    etag: str
+
+
+class StaticAssets:
+    """Caches static files: gzip copies built at startup, plus open descriptors.
+
+    Open files are shared between request threads. They are only read through
+    `os.sendfile` with an explicit offset, which never touches the shared file
+    position. Evicted entries are not closed explicitly; the file closes once
+    no in-flight request still references it.
+    """
+
+    def __init__(self, static_dir: Path) -> None:
+        self.static_dir = static_dir
+        self._gzipped: Dict[str, _GzipAsset] = {}
+        self._open: "OrderedDict[str, _OpenFile]" = OrderedDict()
+        self._open_lock = threading.Lock()
+        for path in static_dir.rglob("*"):
+            if path.suffix in _COMPRESSIBLE_SUFFIXES and path.is_file():
+                self._compress(str(path))
+
+    def _compress(self, path: str) -> Optional[_GzipAsset]:
+        try:
+            mtime = os.stat(path).st_mtime
+            with open(path, "rb") as f:
+                raw = f.read()
+        except OSError:
+            return None
+        asset = _GzipAsset(
+            mtime=mtime, etag=_body_etag(raw)[:-1] + '-gz"', body=gzip.compress(raw, 9)
+        )
+        self._gzipped[path] = asset
+        return asset
+
+    def gzipped(self, path: str) -> Optional[_GzipAsset]:
+        """Return the compressed copy of `path`, recompressing it if the file changed."""
+        asset = self._gzipped.get(path)
+        if asset is None:
+            return None
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            return None
+        if mtime != asset.mtime:
+            asset = self._compress(path)
+        return asset
+
+    def open_file(self, path: str) -> Optional[_OpenFile]:
+        """Return a cached open handle for `path`, reopening it if the file changed."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        with self._open_lock:
+            entry = self._open.get(path)
+            if entry is not None and entry.mtime == st.st_mtime and entry.size == st.st_size:
+                self._open.move_to_end(path)
+                return entry
+        try:
+            f = open(path, "rb", buffering=0)
+        except OSError:
+            return None
+        st = os.fstat(f.fileno())
+        entry = _OpenFile(
+            file=f,
+            size=st.st_size,
+            mtime=st.st_mtime,
+            etag=f'"{st.st_mtime_ns:x}-{st.st_size:x}"',
+        )
+        with self._open_lock:
+            self._open[path] = entry
+            self._open.move_to_end(path)
+            while len(self._open) > _OPEN_FILE_CACHE_SIZE:
+                self._open.popitem(last=False)
+        return entry
+
+
+# Refreshes the distinct event files of a batch request side by side.
+_batch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="dashboard-batch")
 
 
 class DashboardHandler(SimpleHTTPRequestHandler):
     """Handles API requests and serves the static dashboard."""
 
-    def __init__(
-        self,
-        *args,
+    # Keep connections open between polls so the dashboard reuses one socket
+    # instead of reconnecting for every request. Every response carries a
+    # Content-Length, which HTTP/1.1 persistence requires. A kept-alive
+    # connection holds its pool worker, so `end_headers` only grants keep-alive
+    # while the server has workers to spare (see PooledHTTPServer).
+    protocol_version = "HTTP/1.1"
+    # Idle keep-alive connections give their worker back after this many seconds.
+    timeout = 15
+    # Set when the request body was left unread; the connection must not be reused.
+    _force_close = False
+
+    # Shared state is bound once on a subclass (see `bind`) rather than passed
+    # to every per-connection instance.
+    results_dir: Path
+    event_cache: EventCache
+    response_cache: ResponseCache
+    static_assets: StaticAssets
+    static_root: str
+
+    @classmethod
+    def bind(
+        cls,
         results_dir: Path,
         event_cache: EventCache,
-        static_dir: Path,
-        **kwargs,
-    ) -> None:
-        self.results_dir = results_dir
-        self.event_cache = event_cache
-        super().__init__(*args, directory=str(static_dir), **kwargs)
+        response_cache: ResponseCache,
+        static_assets: StaticAssets,
+    ) -> type:
+        """Return a handler subclass with the server's shared state as class attributes."""
+
+        class _BoundHandler(cls):
+            pass
+
+        _BoundHandler.results_dir = results_dir
+        _BoundHandler.event_cache = event_cache
+        _BoundHandler.response_cache = response_cache
+        _BoundHandler.static_assets = static_assets
+        _BoundHandler.static_root = str(static_assets.static_dir)
+        return _BoundHandler
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, directory=self.static_root, **kwargs)
+
+    def end_headers(self) -> None:
+        if not self.close_connection and (
+            self._force_close or not self.server.keep_alive_allowed()
+        ):
+            self.send_header("Connection", "close")  # also sets close_connection
+        super().end_headers()
 
     # Silence the default noisy log.
     def log_message(self, fmt: str, *args) -> None:  # pragma: no cover - keep quiet
         sys.stderr.write("%s\n" % (fmt % args))
 
     def do_GET(self) -> None:
-        parsed = urlparse(self.path)
-        if parsed.path == "/api/runs":
-            return self.handle_runs()
-        if parsed.path == "/api/metrics":
-            return self.handle_metrics(parsed.query)
+        parsed = _parse_url(self.path)
+        route = self._routes.get(parsed.path)
+        if route is not None:
+            return route(self, parsed.query)
+        if self._serve_static(parsed.path):
+            return None
         return super().do_GET()
 
-    def handle_runs(self) -> None:
+    def do_POST(self) -> None:
+        parsed = _parse_url(self.path)
+        route = self._post_routes.get(parsed.path)
+        if route is None:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return None
+        return route(self, parsed.query)
+
+    def handle_runs(self, query: str = "") -> None:
         runs = discover_runs(self.results_dir)
         grouped: Dict[str, dict] = {}
         for r in runs:
@@ -149,14 +737,15 @@ class DashboardHandler(SimpleHTTPRequestHandler):
         self._write_json(payload)
 
     def handle_metrics(self, query: str) -> None:
-        params = parse_qs(query)
-        run_id = params.get("run", [None])[0]
-        behavior = params.get("behavior", [None])[0]
-        limit_raw = params.get("limit", [200])[0]
-        try:
-            limit = max(1, min(int(limit_raw), 2000))
-        except ValueError:
-            limit = 200
+        """Serve the newest `limit` points per scalar tag for one run/behavior.
+
+        `precision=half` (the default) rounds `value` to four significant
+        digits, which is plenty for plotting and keeps the payload small. Pass
+        `precision=full` for the values as logged.
+        """
+        run_id, behavior, limit_raw, precision = _parse_metrics_query(query)
+        limit = _parse_limit(limit_raw)
+        half = precision != "full"
 
         if not run_id or not behavior:
             self._write_json(
@@ -173,41 +762,329 @@ class DashboardHandler(SimpleHTTPRequestHandler):
             return
 
         try:
-            acc = self.event_cache.get(event_file.event_path)
-            tags = acc.Tags().get("scalars", [])
-            data: Dict[str, List[dict]] = {}
-            for tag in tags:
-                events = acc.Scalars(tag)[-limit:]
-                data[tag] = [
-                    {"step": ev.step, "value": float(ev.value), "wall_time": ev.wall_time}
-                    for ev in events
-                ]
-            payload = {
-                "run": run_id,
-                "behavior": behavior,
-                "event_path": str(event_file.event_path),
-                "updated_at": event_file.updated_at,
-                "tags": tags,
-                "data": data,
-            }
-            self._write_json(payload)
-        except RuntimeError as exc:
+            mtime = os.stat(event_file.event_path).st_mtime
+        except OSError:
+            self._write_json(
+                {"error": f"Event file for run '{run_id}' and behavior '{behavior}' is gone"},
+                status=HTTPStatus.NOT_FOUND,
+            )
+            return
+
+        # The event file only changes when the trainer appends to it, so the
+        # serialized body is reusable for as long as its mtime stays put.
+        use_gzip = self._accepts_gzip()
+        variant = ("-half" if half else "-full") + ("-gz" if use_gzip else "")
+        etag = f'"{mtime}-{limit}{variant}"'
+        if self.headers.get("If-None-Match") == etag:
+            self._write_not_modified(etag)
+            return
+        cached = self.response_cache.get(
+            (str(event_file.event_path), mtime, limit, half, use_gzip)
+        )
+        if cached is not None:
+            self._write_body(cached[0], etag=etag, content_encoding=cached[1])
+            return
+
+        try:
+            reader = self.event_cache.get(event_file.event_path)
+        except (RuntimeError, OSError) as exc:
             self._write_json({"error": str(exc)}, status=HTTPStatus.INTERNAL_SERVER_ERROR)
+            return
+        payload = self._metrics_payload(reader, event_file, limit, half)
+        # Key the rebuilt body by what the reader actually loaded: a reload
+        # skipped by coalescing may predate the mtime we just observed.
+        loaded_mtime = payload["updated_at"]
+        body, encoding = self._encode(_dumps(payload), use_gzip)
+        self.response_cache.put(
+            (str(event_file.event_path), loaded_mtime, limit, half, use_gzip), (body, encoding)
+        )
+        self._write_body(body, etag=f'"{loaded_mtime}-{limit}{variant}"', content_encoding=encoding)
+
+    def handle_metrics_batch(self, query: str = "") -> None:
+        """Serve several run/behavior series in one response.
+
+        The request body is a JSON list of `{"run", "behavior", "limit",
+        "precision"}` objects (limit and precision as for `/api/metrics`). The
+        response is `{"results": {"<run>/<behavior>": payload}}`, where a payload
+        that could not be produced is `{"error": message}`.
+        """
+        try:
+            length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            length = -1
+        if length < 0:
+            self._force_close = True
+            self._write_json(
+                {"error": "Content-Length is required"}, status=HTTPStatus.LENGTH_REQUIRED
+            )
+            return
+        if length > _MAX_BATCH_BODY:
+            # The unread body would be parsed as the next request; drop the connection.
+            self._force_close = True
+            self._write_json(
+                {"error": f"request body exceeds {_MAX_BATCH_BODY} bytes"},
+                status=HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+            )
+            return
+        try:
+            items = _loads(self.rfile.read(length))
+        except ValueError:
+            items = None
+        if not isinstance(items, list) or not all(isinstance(i, dict) for i in items):
+            self._write_json(
+                {"error": "body must be a JSON list of {run, behavior} objects"},
+                status=HTTPStatus.BAD_REQUEST,
+            )
+            return
+
+        results: Dict[str, dict] = {}
+        wanted: List[Tuple[str, BehaviorEventFile, int, bool]] = []
+        for item in items:
+            run_id, behavior = item.get("run"), item.get("behavior")
+            key = f"{run_id}/{behavior}"
+            if not isinstance(run_id, str) or not isinstance(behavior, str):
+                results[key] = {"error": "run and behavior are required"}
+                continue
+            event_file = self._find_event_file(run_id, behavior)
+            if not event_file:
+                results[key] = {
+                    "error": f"No event file found for run '{run_id}' and behavior '{behavior}'"
+                }
+                continue
+            half = item.get("precision") != "full"
+            wanted.append((key, event_file, _parse_limit(item.get("limit")), half))
+
+        readers = self._refresh_readers(list({w[1].event_path for w in wanted}))
+        for key, event_file, limit, half in wanted:
+            reader = readers[event_file.event_path]
+            if isinstance(reader, Exception):
+                results[key] = {"error": str(reader)}
+            else:
+                results[key] = self._metrics_payload(reader, event_file, limit, half)
+        self._write_json({"results": results})
+
+    def _refresh_readers(self, paths: List[Path]) -> Dict[Path, object]:
+        """Refresh the readers for `paths`, in parallel when there is more than one.
+
+        Maps each path to its reader, or to the exception that loading it raised,
+        so one bad event file becomes a per-item error instead of failing the batch.
+        """
+
+        def load(path: Path) -> object:
+            try:
+                return self.event_cache.get(path)
+            except Exception as exc:
+                return exc
+
+        if len(paths) <= 1:
+            return {path: load(path) for path in paths}
+        return dict(zip(paths, _batch_executor.map(load, paths)))
+
+    @staticmethod
+    def _metrics_payload(
+        reader: IncrementalTFEventReader, event_file: BehaviorEventFile, limit: int, half: bool
+    ) -> dict:
+        # Read the mtime first: data loaded after it is newer, never older.
+        loaded_mtime = reader.loaded_mtime
+        series = reader.scalars(limit)
+        # Columnar series: one array per field instead of one dict per event.
+        data: Dict[str, Dict[str, "np.ndarray"]] = {}
+        for tag, (steps, values, wall_times) in series.items():
+            if half:
+                values = _round_significant(values)
+            data[tag] = {"step": steps, "value": values, "wall_time": wall_times}
+        return {
+            "run": event_file.run_id,
+            "behavior": event_file.behavior,
+            "event_path": str(event_file.event_path),
+            "updated_at": loaded_mtime,
+            "tags": list(series),
+            "data": data,
+        }
+
+    _routes = {"/api/runs": handle_runs, "/api/metrics": handle_metrics}
+    _post_routes = {"/api/metrics/batch": handle_metrics_batch}
 
     def _find_event_file(self, run_id: str, behavior: str) -> Optional[BehaviorEventFile]:
-        for run in discover_runs(self.results_dir):
-            if run.run_id == run_id and run.behavior == behavior:
-                return run
-        return None
+        # The location follows from the ids, so scan just that directory; the
+        # cached index is only a fallback.
+        return locate_run(self.results_dir, run_id, behavior) or find_run(
+            self.results_dir, run_id, behavior
+        )
+
+    def _accepts_gzip(self) -> bool:
+        return "gzip" in self.headers.get("Accept-Encoding", "")
+
+    @staticmethod
+    def _encode(body: bytes, use_gzip: bool) -> Tuple[bytes, Optional[str]]:
+        if use_gzip and len(body) > _GZIP_MIN_SIZE:
+            # Level 1 is close to memcpy speed and still shrinks metrics JSON several-fold.
+            return gzip.compress(body, compresslevel=1), "gzip"
+        return body, None
 
     def _write_json(self, payload: dict, status: HTTPStatus = HTTPStatus.OK) -> None:
-        body = json.dumps(payload).encode("utf-8")
+        body = _dumps(payload)
+        if status is not HTTPStatus.OK:
+            self._write_body(body, status=status)
+            return
+        use_gzip = self._accepts_gzip()
+        etag = _body_etag(body)
+        if use_gzip:
+            etag = etag[:-1] + '-gz"'
+        if self.headers.get("If-None-Match") == etag:
+            self._write_not_modified(etag)
+            return
+        body, encoding = self._encode(body, use_gzip)
+        self._write_body(body, etag=etag, content_encoding=encoding)
+
+    def _write_body(
+        self,
+        body: bytes,
+        status: HTTPStatus = HTTPStatus.OK,
+        etag: Optional[str] = None,
+        content_encoding: Optional[str] = None,
+        content_type: str = "application/json",
+    ) -> None:
         self.send_response(status.value)
-        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Type", content_type)
         self.send_header("Content-Length", str(len(body)))
+        if content_encoding is not None:
+            self.send_header("Content-Encoding", content_encoding)
+        if etag is not None:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "max-age=1")
+            self.send_header("Vary", "Accept-Encoding")
         self.end_headers()
         self.wfile.write(body)
 
+    def _write_not_modified(self, etag: str) -> None:
+        self.send_response(HTTPStatus.NOT_MODIFIED.value)
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "max-age=1")
+        self.send_header("Vary", "Accept-Encoding")
+        self.end_headers()
+
+    def _serve_static(self, url_path: str) -> bool:
+        """Serve a static file from the caches; return False to fall back to the default."""
+        path = self.translate_path(url_path)
+        if os.path.isdir(path):
+            if not url_path.endswith("/"):
+                return False  # let SimpleHTTPRequestHandler issue its redirect
+            path = os.path.join(path, "index.html")
+
+        if self._accepts_gzip():
+            asset = self.static_assets.gzipped(path)
+            if asset is not None:
+                if self.headers.get("If-None-Match") == asset.etag:
+                    self._write_not_modified(asset.etag)
+                    return True
+                self._write_body(
+                    asset.body,
+                    etag=asset.etag,
+                    content_encoding="gzip",
+                    content_type=self.guess_type(path),
+                )
+                return True
+
+        if not _HAS_SENDFILE:
+            return False
+        entry = self.static_assets.open_file(path)
+        if entry is None:
+            return False
+        if self.headers.get("If-None-Match") == entry.etag:
+            self._write_not_modified(entry.etag)
+            return True
+        self.send_response(HTTPStatus.OK.value)
+        self.send_header("Content-Type", self.guess_type(path))
+        self.send_header("Content-Length", str(entry.size))
+        self.send_header("Last-Modified", self.date_time_string(entry.mtime))
+        self.send_header("ETag", entry.etag)
+        self.send_header("Vary", "Accept-Encoding")
+        self.end_headers()
+        out_fd = self.connection.fileno()
+        in_fd = entry.file.fileno()
+        offset = 0
+        while offset < entry.size:
+            try:
+                sent = os.sendfile(out_fd, in_fd, offset, entry.size - offset)
+            except BlockingIOError:
+                # Sockets with a timeout are non-blocking underneath; wait for
+                # the send buffer to drain before continuing.
+                poller = select.poll()
+                poller.register(out_fd, select.POLLOUT)
+                if not poller.poll(self.timeout * 1000):
+                    raise socket.timeout("timed out sending static file")
+                continue
+            if sent == 0:
+                # The file shrank after Content-Length was sent; the body is
+                # short, so the connection cannot carry another response.
+                self.close_connection = True
+                break
+            offset += sent
+        return True
+
+
+class PooledHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer that hands connections to a bounded worker pool.
+
+    A worker stays with its connection until the connection closes, so
+    keep-alive is only offered while at most half the pool is taken. The
+    remaining workers stay free for new clients however many dashboards sit
+    on persistent connections.
+    """
+
+    allow_reuse_address = True
+    request_queue_size = 128
+
+    def __init__(
+        self,
+        server_address,
+        handler_class,
+        max_workers: Optional[int] = None,
+        bind_and_activate: bool = True,
+    ) -> None:
+        if max_workers is None:
+            # Workers mostly wait on sockets, and each kept-alive or idle
+            # preconnected client holds one, so small machines still get 8.
+            max_workers = max(8, min(32, (os.cpu_count() or 1) * 2))
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="dashboard"
+        )
+        self._max_workers = max_workers
+        # Accepted connections that are queued or being served.
+        self._connections: set = set()
+        self._connections_lock = threading.Lock()
+        super().__init__(server_address, handler_class, bind_and_activate)
+
+    def process_request(self, request, client_address) -> None:
+        with self._connections_lock:
+            self._connections.add(request)
+        self._executor.submit(self._process_and_release, request, client_address)
+
+    def _process_and_release(self, request, client_address) -> None:
+        try:
+            self.process_request_thread(request, client_address)
+        finally:
+            with self._connections_lock:
+                self._connections.discard(request)
+
+    def keep_alive_allowed(self) -> bool:
+        return len(self._connections) <= self._max_workers // 2
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        # Pool threads are not daemons, so the interpreter waits for them on
+        # exit. Shutting the sockets down wakes any worker parked in a
+        # keep-alive read, and closes the connections whose turn never came.
+        with self._connections_lock:
+            connections = list(self._connections)
+        for request in connections:
+            try:
+                request.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -229,6 +1106,18 @@ def parse_args() -> argparse.Namespace:
         default=Path(__file__).parent / "web",
         help="Path to static assets (default: monitor/web).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of server processes sharing one listening socket (POSIX only; default: 1).",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="Request-handling threads per process (default: 2 per CPU, from 8 up to 32).",
+    )
     return parser.parse_args()
 
 
@@ -239,26 +1128,87 @@ def main() -> None:
     static_dir.mkdir(parents=True, exist_ok=True)
 
     event_cache = EventCache()
+    response_cache = ResponseCache()
+    static_assets = StaticAssets(static_dir)
 
-    handler = lambda *h_args, **h_kwargs: DashboardHandler(
-        *h_args,
+    handler = DashboardHandler.bind(
         results_dir=results_dir,
         event_cache=event_cache,
-        static_dir=static_dir,
-        **h_kwargs,
+        response_cache=response_cache,
+        static_assets=static_assets,
     )
 
-    server = ThreadingHTTPServer((args.host, args.port), handler)
-    print(
-        f"Live dashboard ready: http://{args.host}:{args.port} "
-        f"(monitoring runs under {results_dir})"
-    )
+    workers = max(1, args.workers)
+    if workers > 1 and not _CAN_PREFORK:
+        print("--workers needs os.fork; running a single process.")
+        workers = 1
+
+    # Bind and listen once, before forking, so the port stays exclusive and
+    # every worker accepts from the same socket. Losing an accept race must not
+    # block a worker, so the shared socket is non-blocking.
+    max_workers = max(1, args.max_workers) if args.max_workers is not None else None
+    server = PooledHTTPServer((args.host, args.port), handler, max_workers=max_workers)
+    children: List[int] = []
+    is_child = False
+    if workers > 1:
+        server.socket.setblocking(False)
+
+        def reap_children(signum, frame) -> None:
+            while children:
+                try:
+                    pid, status = os.waitpid(-1, os.WNOHANG)
+                except ChildProcessError:
+                    return
+                if pid == 0:
+                    return
+                if pid in children:
+                    children.remove(pid)
+                code = os.waitstatus_to_exitcode(status)
+                if code != 0:
+                    print(
+                        f"Dashboard worker {pid} exited with status {code}; "
+                        f"{len(children) + 1} processes still serving.",
+                        file=sys.stderr,
+                    )
+
+        signal.signal(signal.SIGCHLD, reap_children)
+        # Turn SIGTERM into a normal exit so the parent still stops its workers.
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
     try:
+        # Fork before any server threads exist; each process gets its own copy
+        # of the caches above.
+        for _ in range(workers - 1):
+            pid = os.fork()
+            if pid == 0:
+                is_child = True
+                children.clear()
+                signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                break
+            children.append(pid)
+        if not is_child:
+            workers_note = f", {workers} worker processes" if workers > 1 else ""
+            print(
+                f"Live dashboard ready: http://{args.host}:{args.port} "
+                f"(monitoring runs under {results_dir}{workers_note})"
+            )
         server.serve_forever()
     except KeyboardInterrupt:
-        print("\nStopping dashboard...")
+        if not is_child:
+            print("\nStopping dashboard...")
     finally:
         server.server_close()
+        if workers > 1 and not is_child:
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
 
 
 if __name__ == "__main__":